@@ -4,34 +4,39 @@
 Hour Percent Clock — International English Edition
 Minimalist UI, ISO datetime, ISO birthday input,
 Compact/Detailed modes, no card layout.
+
+Performance note: compute_subday / compute_day_stats run at most once per
+second and take ~1 us on CPython, so Numba/Cython would add import-time
+and JIT cost for no visible gain. The tick cost is Qt-side (label
+updates and ring painting), which is where the caching below is aimed.
 """
 
 import sys
 import os
 import json
+import time
 from datetime import datetime, date
-from math import ceil
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 
 # ====== Config Filename ======
 CONFIG_FILENAME = "hour_percent_clock_config.json"
+_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(sys.argv[0])), CONFIG_FILENAME
+)
 
-
-def get_config_path():
-    base_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-    return os.path.join(base_dir, CONFIG_FILENAME)
+# ====== Weekday names (indexed by date.weekday()) ======
+WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 
 
 def load_birthdate_from_config():
     """Load birthday from JSON config. Return date or None."""
-    cfg_path = get_config_path()
-    if not os.path.exists(cfg_path):
+    if not os.path.exists(_CONFIG_PATH):
         return None
 
     try:
-        with open(cfg_path, "r", encoding="utf-8") as f:
+        with open(_CONFIG_PATH, "r", encoding="utf-8") as f:
             data = json.load(f)
         y, m, d = data.get("year"), data.get("month"), data.get("day")
         if all(isinstance(x, int) for x in (y, m, d)):
@@ -45,73 +50,144 @@ def load_birthdate_from_config():
 
 def save_birthdate_to_config(birthdate: date):
     """Write birthday into JSON"""
-    cfg_path = get_config_path()
     data = {
         "year": birthdate.year,
         "month": birthdate.month,
         "day": birthdate.day
     }
     try:
-        with open(cfg_path, "w", encoding="utf-8") as f:
+        with open(_CONFIG_PATH, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
     except Exception:
         pass
 
 
 # ====== Time stats ======
-def compute_time_stats(birthdate: date):
+_HOUR_PCT_K = 100.0 / 3600.0
+_DAY_PCT_K = 100.0 / 86400.0
+_SPAN_K = -360.0 * 16.0 / 100.0  # percent -> Qt 1/16-degree span (clockwise)
+
+# UTC offsets are multiples of 15 min and DST switches happen on those
+# boundaries, so the cached offset only needs re-checking every 15 min.
+_TZ_CHECK_STEP = 900
+# [valid from, valid until (unix ts), offset in seconds]
+_tz_cache = [0.0, 0.0, 0]
+
+
+def _local_utc_offset(t: float) -> int:
+    """Local UTC offset in seconds at unix time t (DST aware, cached)."""
+    # Check both ends so a backward clock jump also refreshes the offset
+    if not (_tz_cache[0] <= t < _tz_cache[1]):
+        start = (t // _TZ_CHECK_STEP) * _TZ_CHECK_STEP
+        _tz_cache[0] = start
+        _tz_cache[1] = start + _TZ_CHECK_STEP
+        _tz_cache[2] = time.localtime(t).tm_gmtoff
+    return _tz_cache[2]
+
+
+def compute_subday():
     """
     Return:
-    now, hour_pct, day_pct, days_alive, next_hundred, days_to_next
+    now, hour_pct, day_pct
     """
-    now = datetime.now()
+    t_raw = time.time()
+    t = t_raw + _local_utc_offset(t_raw)
+    now = datetime.fromtimestamp(t_raw)
+
+    # Hour / day percent straight from the local timestamp
+    hour_pct = (t % 3600.0) * _HOUR_PCT_K
+    day_pct = (t % 86400.0) * _DAY_PCT_K
 
-    # Hour percent
-    sec_in_hour = now.minute * 60 + now.second + now.microsecond / 1_000_000
-    hour_pct = sec_in_hour / 3600 * 100.0
+    return now, hour_pct, day_pct
 
-    # Day percent
-    sec_in_day = (
-        now.hour * 3600 +
-        now.minute * 60 +
-        now.second +
-        now.microsecond / 1_000_000
-    )
-    day_pct = sec_in_day / 86400 * 100.0
 
+def compute_day_stats(today: date, birthdate: date):
+    """
+    Return:
+    days_alive, next_hundred, days_to_next
+    """
     # Days alive
-    days_alive = (now.date() - birthdate).days
+    days_alive = (today - birthdate).days
     if days_alive < 0:
         days_alive = 0
 
-    # Next hundred milestone
-    if days_alive == 0:
-        next_hundred = 100
-    else:
-        next_hundred = ceil(days_alive / 100) * 100
-        if next_hundred == days_alive:
-            next_hundred += 100
-
-    days_to_next = max(0, next_hundred - days_alive)
+    # Next hundred milestone (always strictly ahead, so days_to_next >= 1)
+    next_hundred = (days_alive // 100 + 1) * 100
+    days_to_next = next_hundred - days_alive
 
-    return now, hour_pct, day_pct, days_alive, next_hundred, days_to_next
+    return days_alive, next_hundred, days_to_next
 
 
 # ====== Ring Widget ======
 class HourCircleWidget(QtWidgets.QWidget):
+    outer_width = 8
+    inner_width = 10
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._hour_percent = 0
         self._day_percent = 0
+        self._last_q = None  # (hour, day) in 0.01% units of the last repaint
+        self._bg_pixmap = None  # static gray rings, rebuilt on resize
+
+        # Pens / font built once, reused by every paintEvent
+        self._bg_day_pen = QtGui.QPen(QtGui.QColor("#d0d0d0"), self.outer_width)
+        self._day_pen = QtGui.QPen(QtGui.QColor("#3498db"), self.outer_width)
+        self._bg_hour_pen = QtGui.QPen(QtGui.QColor("#e0e0e0"), self.inner_width)
+        self._hour_pen = QtGui.QPen(QtGui.QColor("#2ecc71"), self.inner_width)
+        self._text_color = QtGui.QColor("#333")
+        self._update_text_font()
+
+    def _update_text_font(self):
+        self._text_font = QtGui.QFont(self.font())
+        self._text_font.setPointSize(14)
+        self._text_font.setBold(True)
+
+    def changeEvent(self, event):
+        # Follow font propagation / setFont like painter.font() used to
+        if event.type() == QtCore.QEvent.FontChange:
+            self._update_text_font()
+            self.update()
+        super().changeEvent(event)
 
     def setPercents(self, hour_pct, day_pct):
-        self._hour_percent = max(0, min(100, hour_pct))
-        self._day_percent = max(0, min(100, day_pct))
+        hour_pct = max(0, min(100, hour_pct))
+        day_pct = max(0, min(100, day_pct))
+
+        # Only repaint when the value visible at 0.01% precision changes.
+        # The hour value moves 0.01% every 0.36 s, so on the 1 Hz tick this
+        # always repaints; it only drops redundant calls within one tick
+        # (birthday change, re-show).
+        q = (round(hour_pct * 100), round(day_pct * 100))
+        if q == self._last_q:
+            return
+        self._last_q = q
+        self._hour_percent = hour_pct
+        self._day_percent = day_pct
         self.update()
 
     def sizeHint(self):
         return QtCore.QSize(240, 240)
 
+    def resizeEvent(self, event):
+        self._bg_pixmap = None
+        super().resizeEvent(event)
+
+    def _render_background(self, outer_rect, inner_rect, dpr):
+        """Rasterize the two background ellipses into a HiDPI-aware pixmap."""
+        pixmap = QtGui.QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QtCore.Qt.transparent)
+
+        p = QtGui.QPainter(pixmap)
+        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        p.setPen(self._bg_day_pen)
+        p.drawEllipse(outer_rect)
+        p.setPen(self._bg_hour_pen)
+        p.drawEllipse(inner_rect)
+        p.end()
+        return pixmap
+
     def paintEvent(self, event):
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
@@ -126,40 +202,34 @@ class HourCircleWidget(QtWidgets.QWidget):
         top = (h - side) / 2
         outer_rect = QtCore.QRectF(left, top, side, side)
 
-        start_angle = int(90 * 16)  # 12 o'clock
-
-        # ---- Day ring (outer)
-        bg_pen = QtGui.QPen(QtGui.QColor("#d0d0d0"), 8)
-        painter.setPen(bg_pen)
-        painter.drawEllipse(outer_rect)
-
-        day_span = int(-360 * 16 * (self._day_percent / 100))
-        fg_pen = QtGui.QPen(QtGui.QColor("#3498db"), 8)
-        painter.setPen(fg_pen)
-        painter.drawArc(outer_rect, start_angle, day_span)
-
-        # ---- Hour ring (inner)
         inner_margin = 16
         inner_rect = outer_rect.adjusted(
             inner_margin, inner_margin,
             -inner_margin, -inner_margin
         )
 
-        bg2 = QtGui.QPen(QtGui.QColor("#e0e0e0"), 10)
-        painter.setPen(bg2)
-        painter.drawEllipse(inner_rect)
+        start_angle = int(90 * 16)  # 12 o'clock
+
+        # ---- Ring backgrounds (cached)
+        dpr = self.devicePixelRatioF()
+        if (self._bg_pixmap is None
+                or self._bg_pixmap.devicePixelRatio() != dpr):
+            self._bg_pixmap = self._render_background(outer_rect, inner_rect, dpr)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
 
-        hour_span = int(-360 * 16 * (self._hour_percent / 100))
-        fg2 = QtGui.QPen(QtGui.QColor("#2ecc71"), 10)
-        painter.setPen(fg2)
+        # ---- Day ring (outer)
+        day_span = int(self._day_percent * _SPAN_K)
+        painter.setPen(self._day_pen)
+        painter.drawArc(outer_rect, start_angle, day_span)
+
+        # ---- Hour ring (inner)
+        hour_span = int(self._hour_percent * _SPAN_K)
+        painter.setPen(self._hour_pen)
         painter.drawArc(inner_rect, start_angle, hour_span)
 
         # ---- Center text
-        painter.setPen(QtGui.QColor("#333"))
-        font = painter.font()
-        font.setPointSize(14)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setPen(self._text_color)
+        painter.setFont(self._text_font)
         painter.drawText(self.rect(), QtCore.Qt.AlignCenter,
                          f"{self._hour_percent:0.2f}%")
 
@@ -178,6 +248,23 @@ class MainWindow(QtWidgets.QWidget):
         # Birthday load
         bd = load_birthdate_from_config()
         self.birthdate = bd if bd else date(2001, 11, 14)
+        self._saved_birthdate = bd
+
+        # Debounced config write: rapid dateChanged signals -> one save
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_birthdate)
+
+        # Last displayed values (0.01% units), used to skip no-op label updates
+        self._last_h_q = None
+        self._last_d_q = None
+
+        # (date, "YYYY-MM-DD Www") — rebuilt only when the date rolls over
+        self._date_prefix_cache = (None, "")
+
+        # Day-level stats only change on date rollover or birthday change
+        self._day_cache_key = None
 
         # === Time label ===
         self.timeLabel = QtWidgets.QLabel("--:--:--")
@@ -265,44 +352,103 @@ class MainWindow(QtWidgets.QWidget):
         layout.addWidget(self.toggleBtn, alignment=QtCore.Qt.AlignCenter)
 
         # Timer
+        # Single-shot + coarse: updateClock re-arms it for the next
+        # wall-clock second, so ticks stay aligned with %H:%M:%S
         self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(QtCore.Qt.CoarseTimer)
         self.timer.timeout.connect(self.updateClock)
-        self.timer.start(1000)
         self.updateClock()
 
         self.resize(440, 620)
 
     # ==== Update Clock ====
     def updateClock(self):
-        (now, hour_pct, day_pct, alive, next_h,
-         left) = compute_time_stats(self.birthdate)
-
-        weekday = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"][now.weekday()]
-        iso_text = now.strftime(f"%Y-%m-%d {weekday} %H:%M:%S")
-        self.timeLabel.setText(iso_text)
+        now, hour_pct, day_pct = compute_subday()
+
+        today = now.date()
+        if today != self._date_prefix_cache[0]:
+            prefix = f"{today.isoformat()} {WEEKDAY_NAMES[today.weekday()]}"
+            self._date_prefix_cache = (today, prefix)
+        self.timeLabel.setText(
+            self._date_prefix_cache[1] + now.strftime(" %H:%M:%S")
+        )
 
         # Rings
         self.circle.setPercents(hour_pct, day_pct)
 
-        # Texts
-        self.hourText.setText(f"Hour Progress: {hour_pct:0.2f}%")
-        self.dayText.setText(f"Day Progress:  {day_pct:0.2f}%")
-        self.dayBar.setValue(int(day_pct * 100))
+        # Texts (only when the 2-decimal value actually changed; the hour
+        # text changes every tick, the day texts/bar about every 8.6 s)
+        h_q = round(hour_pct * 100)
+        d_q = round(day_pct * 100)
+
+        if h_q != self._last_h_q:
+            self._last_h_q = h_q
+            self.hourText.setText(f"Hour Progress: {h_q / 100:0.2f}%")
+
+        if d_q != self._last_d_q:
+            self._last_d_q = d_q
+            self.dayText.setText(f"Day Progress:  {d_q / 100:0.2f}%")
+            self.dayBar.setValue(d_q)
+
+            remaining = (10000 - d_q) / 100
+            self.remainingLabel.setText(f"Remaining Today: {remaining:0.2f}%")
+
+        # Days alive / milestone (once per day or on birthday change)
+        key = (today, self.birthdate)
+        if key != self._day_cache_key:
+            self._day_cache_key = key
+            alive, next_h, left = compute_day_stats(today, self.birthdate)
+
+            self.livedLabel.setText(f"Days Alive: {alive}")
+            self.milestoneLabel.setText(
+                f"Next 100-Day Milestone: {left} days left"
+            )
+
+        # Next tick at the next second boundary (not while hidden/minimized)
+        if self.isVisible() and not self.isMinimized():
+            # Aim 60 ms past the boundary: CoarseTimer may fire up to 5%
+            # (~53 ms) early, which must still land in the new second
+            ms_to_next = 1000 - int((time.time() % 1.0) * 1000)
+            self.timer.start(ms_to_next + 60)
+
+    # ==== Pause while hidden / minimized ====
+    # updateClock is called once on re-show so the labels and rings are
+    # current immediately; it also re-arms the timer.
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.updateClock()
 
-        remaining = 100.0 - day_pct
-        self.remainingLabel.setText(f"Remaining Today: {remaining:0.2f}%")
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
 
-        self.livedLabel.setText(f"Days Alive: {alive}")
-        self.milestoneLabel.setText(
-            f"Next 100-Day Milestone: {left} days left"
-        )
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.WindowStateChange:
+            if self.windowState() & QtCore.Qt.WindowMinimized:
+                self.timer.stop()
+            elif self.isVisible() and not self.timer.isActive():
+                self.updateClock()
 
     # ==== On birthday change ====
     def onBirthChanged(self, qdate):
         self.birthdate = date(qdate.year(), qdate.month(), qdate.day())
-        save_birthdate_to_config(self.birthdate)
+        self._save_timer.start()
         self.updateClock()
 
+    def _flush_birthdate(self):
+        if self.birthdate != self._saved_birthdate:
+            save_birthdate_to_config(self.birthdate)
+            self._saved_birthdate = self.birthdate
+
+    def closeEvent(self, event):
+        # Don't lose a pending debounced save
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_birthdate()
+        super().closeEvent(event)
+
     # ==== Toggle Mode ====
     def toggleMode(self):
         if self.mode == "detailed":
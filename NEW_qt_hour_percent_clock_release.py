@@ -10,34 +10,39 @@ Qt Hour Percent Clock - Public Version
 - 文本区：Day 百分比、今日剩余百分比、已生存天数、下一个整百天倒计时
 - 用户可以通过日期选择控件设置自己的生日
 - 生日会保存在同目录的 JSON 配置文件中，下次启动自动读取
+
+性能说明：
+- compute_subday / compute_day_stats 每秒最多调用一次，CPython 下约 1 µs，
+  不需要 Numba / Cython（只会增加导入和 JIT 的启动开销）
+- 每次刷新的主要开销在 Qt 侧（文本更新、圆环绘制），优化集中在那里
 """
 
 import sys
 import os
 import json
+import time
 from datetime import datetime, date
-from math import ceil
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 # ====== 配置文件相关 ======
 CONFIG_FILENAME = "hour_percent_clock_config.json"
+# 配置文件路径（与 exe / 脚本同目录），启动时计算一次
+_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(sys.argv[0])), CONFIG_FILENAME
+)
 
-
-def get_config_path() -> str:
-    """返回配置文件路径（与 exe / 脚本同目录）"""
-    base_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-    return os.path.join(base_dir, CONFIG_FILENAME)
+# 星期显示（按 date.weekday() 索引）
+WEEKDAY_NAMES = ("一", "二", "三", "四", "五", "六", "日")
 
 
 def load_birthdate_from_config() -> date | None:
     """从配置文件中读取生日，如果失败则返回 None"""
-    config_path = get_config_path()
-    if not os.path.exists(config_path):
+    if not os.path.exists(_CONFIG_PATH):
         return None
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
+        with open(_CONFIG_PATH, "r", encoding="utf-8") as f:
             data = json.load(f)
         y, m, d = data.get("year"), data.get("month"), data.get("day")
         if not all(isinstance(x, int) for x in (y, m, d)):
@@ -53,10 +58,9 @@ def load_birthdate_from_config() -> date | None:
 
 def save_birthdate_to_config(birthdate: date) -> None:
     """将生日保存到配置文件"""
-    config_path = get_config_path()
     data = {"year": birthdate.year, "month": birthdate.month, "day": birthdate.day}
     try:
-        with open(config_path, "w", encoding="utf-8") as f:
+        with open(_CONFIG_PATH, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
     except Exception:
         # 写入失败也不要影响程序运行
@@ -64,46 +68,67 @@ def save_birthdate_to_config(birthdate: date) -> None:
 
 
 # ====== 核心时间计算逻辑 ======
-def compute_time_stats(birthdate: date):
+_HOUR_PCT_K = 100.0 / 3600.0
+_DAY_PCT_K = 100.0 / 86400.0
+# 百分比 → Qt 角度（1/16 度，顺时针为负）
+_SPAN_K = -360.0 * 16.0 / 100.0
+
+# 时区偏移都是 15 分钟的整数倍，夏令时切换也落在这些边界上，
+# 所以缓存的偏移每 15 分钟检查一次就够了
+_TZ_CHECK_STEP = 900
+# [有效期开始, 有效期截止 (unix 时间戳), 偏移秒数]
+_tz_cache = [0.0, 0.0, 0]
+
+
+def _local_utc_offset(t: float) -> int:
+    """返回时间戳 t 对应的本地 UTC 偏移（秒，含夏令时，带缓存）"""
+    # 两端都要检查：系统时间往回调时也要重新读取偏移
+    if not (_tz_cache[0] <= t < _tz_cache[1]):
+        start = (t // _TZ_CHECK_STEP) * _TZ_CHECK_STEP
+        _tz_cache[0] = start
+        _tz_cache[1] = start + _TZ_CHECK_STEP
+        _tz_cache[2] = time.localtime(t).tm_gmtoff
+    return _tz_cache[2]
+
+
+def compute_subday():
     """
     返回:
     - now: 当前时间 (datetime)
     - hour_pct: 当前小时已过百分比 (0-100)
     - day_pct: 当前日已过百分比 (0-100)
-    - days_alive: 已生存天数
-    - next_hundred: 下一个整百天(如 2500)
-    - days_to_next: 距离下一个整百天的天数
     """
-    now = datetime.now()
+    t_raw = time.time()
+    # 本地时间戳：直接对 3600 / 86400 取模即可得到小时内 / 天内秒数
+    t = t_raw + _local_utc_offset(t_raw)
+    now = datetime.fromtimestamp(t_raw)
 
     # 小时百分比
-    sec_in_hour = now.minute * 60 + now.second + now.microsecond / 1_000_000
-    hour_pct = sec_in_hour / 3600.0 * 100.0
+    hour_pct = (t % 3600.0) * _HOUR_PCT_K
 
     # 天百分比
-    sec_in_day = (
-        now.hour * 3600
-        + now.minute * 60
-        + now.second
-        + now.microsecond / 1_000_000
-    )
-    day_pct = sec_in_day / 86400.0 * 100.0
+    day_pct = (t % 86400.0) * _DAY_PCT_K
 
+    return now, hour_pct, day_pct
+
+
+def compute_day_stats(today: date, birthdate: date):
+    """
+    返回:
+    - days_alive: 已生存天数
+    - next_hundred: 下一个整百天(如 2500)
+    - days_to_next: 距离下一个整百天的天数
+    """
     # 已生存天数
-    days_alive = (now.date() - birthdate).days
+    days_alive = (today - birthdate).days
     if days_alive < 0:
         days_alive = 0
 
-    # 下一个整百天
-    if days_alive == 0:
-        next_hundred = 100
-    else:
-        next_hundred = ceil(days_alive / 100) * 100
-        if next_hundred == days_alive:
-            next_hundred += 100
-    days_to_next = max(0, next_hundred - days_alive)
+    # 下一个整百天（总是严格大于 days_alive）
+    next_hundred = (days_alive // 100 + 1) * 100
+    days_to_next = next_hundred - days_alive
 
-    return now, hour_pct, day_pct, days_alive, next_hundred, days_to_next
+    return days_alive, next_hundred, days_to_next
 
 
 class HourCircleWidget(QtWidgets.QWidget):
@@ -114,19 +139,78 @@ class HourCircleWidget(QtWidgets.QWidget):
     - 中间文字：Hour 百分比
     """
 
+    # 外环 / 内环线宽（固定）
+    outer_width = 8
+    inner_width = 10
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._hour_percent = 0.0
         self._day_percent = 0.0
+        # 上次重绘时的 (hour, day)，单位 0.01%
+        self._last_q = None
+        # 灰色背景圆环的缓存位图，尺寸变化时重建
+        self._bg_pixmap = None
+
+        # 画笔、颜色、字体只创建一次，paintEvent 中直接复用
+        self._bg_day_pen = QtGui.QPen(QtGui.QColor("#e0e0e0"), self.outer_width)
+        self._day_pen = QtGui.QPen(QtGui.QColor("#3498db"), self.outer_width)
+        self._bg_hour_pen = QtGui.QPen(QtGui.QColor("#dddddd"), self.inner_width)
+        self._hour_pen = QtGui.QPen(QtGui.QColor("#2ecc71"), self.inner_width)
+        self._text_color = QtGui.QColor("#333333")
+        self._update_text_font()
+
+    def _update_text_font(self):
+        """根据控件当前字体生成中间文字用的字体"""
+        self._text_font = QtGui.QFont(self.font())
+        self._text_font.setPointSize(14)
+        self._text_font.setBold(True)
+
+    def changeEvent(self, event):
+        # 控件字体变化（setFont / 父控件字体传递）时重建缓存字体
+        if event.type() == QtCore.QEvent.FontChange:
+            self._update_text_font()
+            self.update()
+        super().changeEvent(event)
 
     def setPercents(self, hour_pct: float, day_pct: float):
-        self._hour_percent = max(0.0, min(100.0, hour_pct))
-        self._day_percent = max(0.0, min(100.0, day_pct))
+        hour_pct = max(0.0, min(100.0, hour_pct))
+        day_pct = max(0.0, min(100.0, day_pct))
+
+        # 两位小数精度下没有变化就不重绘。
+        # 注意：Hour 每 0.36 秒就变化 0.01%，1 Hz 刷新时每次都会重绘，
+        # 这里只是过滤同一秒内的重复调用（修改生日、重新显示等）
+        q = (round(hour_pct * 100), round(day_pct * 100))
+        if q == self._last_q:
+            return
+        self._last_q = q
+        self._hour_percent = hour_pct
+        self._day_percent = day_pct
         self.update()
 
     def sizeHint(self):
         return QtCore.QSize(240, 240)
 
+    def resizeEvent(self, event):
+        # 尺寸变了，背景位图作废
+        self._bg_pixmap = None
+        super().resizeEvent(event)
+
+    def _render_background(self, outer_rect, inner_rect, dpr):
+        """把内外两个背景圆环画到位图里（考虑高分屏 devicePixelRatio）"""
+        pixmap = QtGui.QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QtCore.Qt.transparent)
+
+        p = QtGui.QPainter(pixmap)
+        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        p.setPen(self._bg_day_pen)
+        p.drawEllipse(outer_rect)
+        p.setPen(self._bg_hour_pen)
+        p.drawEllipse(inner_rect)
+        p.end()
+        return pixmap
+
     def paintEvent(self, event):
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
@@ -144,46 +228,35 @@ class HourCircleWidget(QtWidgets.QWidget):
         left = (w - side) / 2
         top = (h - side) / 2
         outer_rect = QtCore.QRectF(left, top, side, side)
-        outer_width = 8
 
         # Qt 角度系（从 12 点方向开始，顺时针为负角度）
         start_deg = 90
         start_angle = int(start_deg * 16)
 
-        # --- 外环：Day 进度 ---
-        bg_day_pen = QtGui.QPen(QtGui.QColor("#e0e0e0"), outer_width)
-        painter.setPen(bg_day_pen)
-        painter.drawEllipse(outer_rect)
-
-        day_span_deg = -360 * (self._day_percent / 100.0)
-        day_span_angle = int(day_span_deg * 16)
-        day_pen = QtGui.QPen(QtGui.QColor("#3498db"), outer_width)
-        painter.setPen(day_pen)
-        painter.drawArc(outer_rect, start_angle, day_span_angle)
-
-        # --- 内环：Hour 进度 ---
         inner_margin = 16
         inner_rect = outer_rect.adjusted(
             inner_margin, inner_margin, -inner_margin, -inner_margin
         )
-        inner_width = 10
 
-        bg_hour_pen = QtGui.QPen(QtGui.QColor("#dddddd"), inner_width)
-        painter.setPen(bg_hour_pen)
-        painter.drawEllipse(inner_rect)
+        # --- 背景圆环：只在尺寸 / DPR 变化时重新光栅化 ---
+        dpr = self.devicePixelRatioF()
+        if self._bg_pixmap is None or self._bg_pixmap.devicePixelRatio() != dpr:
+            self._bg_pixmap = self._render_background(outer_rect, inner_rect, dpr)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
 
-        hour_span_deg = -360 * (self._hour_percent / 100.0)
-        hour_span_angle = int(hour_span_deg * 16)
-        hour_pen = QtGui.QPen(QtGui.QColor("#2ecc71"), inner_width)
-        painter.setPen(hour_pen)
+        # --- 外环：Day 进度 ---
+        day_span_angle = int(self._day_percent * _SPAN_K)
+        painter.setPen(self._day_pen)
+        painter.drawArc(outer_rect, start_angle, day_span_angle)
+
+        # --- 内环：Hour 进度 ---
+        hour_span_angle = int(self._hour_percent * _SPAN_K)
+        painter.setPen(self._hour_pen)
         painter.drawArc(inner_rect, start_angle, hour_span_angle)
 
         # --- 中间文字：Hour 百分比 ---
-        painter.setPen(QtGui.QColor("#333333"))
-        font = painter.font()
-        font.setPointSize(14)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setPen(self._text_color)
+        painter.setFont(self._text_font)
 
         text = f"{self._hour_percent:0.2f}%"
         painter.drawText(self.rect(), QtCore.Qt.AlignCenter, text)
@@ -206,6 +279,24 @@ class MainWindow(QtWidgets.QWidget):
         else:
             # 没有配置时的默认生日（可以改成你喜欢的默认值）
             self.birthdate = date(2001, 1, 1)
+        # 已写入配置文件的生日，用于跳过重复写入
+        self._saved_birthdate = loaded_birthdate
+
+        # 生日保存做防抖：连续多次 dateChanged 只写一次文件
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_birthdate)
+
+        # 上次显示的百分比（单位 0.01%），没变化就跳过文本刷新
+        self._last_h_q = None
+        self._last_d_q = None
+
+        # (日期, "YYYY-MM-DD 周X")，只在跨天时重新生成
+        self._date_prefix_cache = (None, "")
+
+        # 生存天数 / 整百天只在跨天或修改生日时变化，按 (日期, 生日) 缓存
+        self._day_cache_key = None
 
         # ====== 顶部时间标签 ======
         self.timeLabel = QtWidgets.QLabel("--:--:--")
@@ -345,10 +436,11 @@ class MainWindow(QtWidgets.QWidget):
         layout.addWidget(self.card)
 
         # ====== 定时器 ======
+        # 单次触发 + 粗精度定时器：每次 updateClock 结束后重新对齐到下一个整秒
         self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(QtCore.Qt.CoarseTimer)
         self.timer.timeout.connect(self.updateClock)
-        # 每秒刷新一次就够
-        self.timer.start(1000)
         self.updateClock()
 
         # 初始窗口尺寸
@@ -356,32 +448,75 @@ class MainWindow(QtWidgets.QWidget):
 
     @QtCore.Slot()
     def updateClock(self):
-        now, hour_pct, day_pct, days_alive, next_hundred, days_to_next = compute_time_stats(
-            self.birthdate
-        )
+        now, hour_pct, day_pct = compute_subday()
 
-        # 显示日期 + 星期 + 时间
-        weekday_map = ["一", "二", "三", "四", "五", "六", "日"]
-        weekday_cn = weekday_map[now.weekday()]
+        # 显示日期 + 星期 + 时间（日期部分按天缓存）
+        today = now.date()
+        if today != self._date_prefix_cache[0]:
+            prefix = f"{today.isoformat()} 周{WEEKDAY_NAMES[today.weekday()]}"
+            self._date_prefix_cache = (today, prefix)
         self.timeLabel.setText(
-            now.strftime(f"%Y-%m-%d 周{weekday_cn}  %H:%M:%S")
+            self._date_prefix_cache[1] + now.strftime("  %H:%M:%S")
         )
 
         # 内外环
         self.circle.setPercents(hour_pct, day_pct)
-        self.hourTextLabel.setText(f"Hour: {hour_pct:0.2f}%")
+
+        # 按两位小数量化，只有显示值变化时才 setText
+        # （Hour 每秒都会变；Day 文本 / 进度条约 8.6 秒才变一次）
+        h_q = round(hour_pct * 100)
+        d_q = round(day_pct * 100)
+
+        if h_q != self._last_h_q:
+            self._last_h_q = h_q
+            self.hourTextLabel.setText(f"Hour: {h_q / 100:0.2f}%")
 
         # Day 百分比 & 剩余
-        self.dayTextLabel.setText(f"Day:  {day_pct:0.2f}%")
-        self.dayBar.setValue(int(day_pct * 100))
-        remaining_pct = max(0.0, 100.0 - day_pct)
-        self.remainingLabel.setText(f"今日剩余：{remaining_pct:0.2f}%")
-
-        # Life & 整百天
-        self.lifeLabel.setText(f"你已经在这个世界上待了： {days_alive} 天")
-        self.nextHundredLabel.setText(
-            f"距离你人生的第 {next_hundred} 天还有： {days_to_next} 天"
-        )
+        if d_q != self._last_d_q:
+            self._last_d_q = d_q
+            self.dayTextLabel.setText(f"Day:  {d_q / 100:0.2f}%")
+            self.dayBar.setValue(d_q)
+            remaining_pct = max(0, 10000 - d_q) / 100
+            self.remainingLabel.setText(f"今日剩余：{remaining_pct:0.2f}%")
+
+        # Life & 整百天（每天或生日变化时才重新计算）
+        key = (today, self.birthdate)
+        if key != self._day_cache_key:
+            self._day_cache_key = key
+            days_alive, next_hundred, days_to_next = compute_day_stats(
+                today, self.birthdate
+            )
+
+            self.lifeLabel.setText(f"你已经在这个世界上待了： {days_alive} 天")
+            self.nextHundredLabel.setText(
+                f"距离你人生的第 {next_hundred} 天还有： {days_to_next} 天"
+            )
+
+        # 下一次在整秒边界触发（窗口隐藏 / 最小化时不再定时）
+        if self.isVisible() and not self.isMinimized():
+            # 目标定在整秒后 60 ms：粗精度定时器最多可能提前 5%（约 53 ms），
+            # 提前触发也要落在新的一秒里
+            ms_to_next = 1000 - int((time.time() % 1.0) * 1000)
+            self.timer.start(ms_to_next + 60)
+
+    # ====== 窗口隐藏 / 最小化时暂停刷新 ======
+    def showEvent(self, event):
+        super().showEvent(event)
+        # 重新显示时立即刷新一次（同时重新启动定时器）
+        self.updateClock()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.WindowStateChange:
+            if self.windowState() & QtCore.Qt.WindowMinimized:
+                self.timer.stop()
+            elif self.isVisible() and not self.timer.isActive():
+                # 从最小化恢复：立即刷新并恢复定时器
+                self.updateClock()
 
     @QtCore.Slot()
     def toggleMode(self):
@@ -398,10 +533,25 @@ class MainWindow(QtWidgets.QWidget):
     def onBirthdateChanged(self, qdate: QtCore.QDate):
         """用户修改生日时回调"""
         self.birthdate = date(qdate.year(), qdate.month(), qdate.day())
-        save_birthdate_to_config(self.birthdate)
+        # 延迟保存（防抖）
+        self._save_timer.start()
         # 立即刷新一次
         self.updateClock()
 
+    @QtCore.Slot()
+    def _flush_birthdate(self):
+        """把当前生日真正写入配置文件"""
+        if self.birthdate != self._saved_birthdate:
+            save_birthdate_to_config(self.birthdate)
+            self._saved_birthdate = self.birthdate
+
+    def closeEvent(self, event):
+        # 关闭前把还没写入的生日保存掉
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_birthdate()
+        super().closeEvent(event)
+
 
 def main():
     app = QtWidgets.QApplication(sys.argv)